@@ -5,16 +5,20 @@ This file implements a relay server for the taskmaster MCP server.
 """
 
 import os
+import gzip
 import json
+import hashlib
 import logging
-from functools import lru_cache
-from typing import Dict, Any, List, Optional
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from typing import Dict, Any, List, NamedTuple, Optional
 
 from fastapi import FastAPI, HTTPException, Request, Response
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
-from fastapi.responses import PlainTextResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse
+from starlette.requests import ClientDisconnect
 import httpx
+import orjson
 import uvicorn
 
 # Configure logging
@@ -29,24 +33,113 @@ UPSTREAM_URL = os.environ.get("UPSTREAM_URL", "https://taskmaster-mcp.fly.dev")
 SERVICE_NAME = os.environ.get("SERVICE_NAME", "taskmaster")
 TASKMASTER_PATH = os.environ.get("TASKMASTER_PATH", "/sss")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share one pooled upstream client across requests for the app's lifetime"""
+    app.state.client = httpx.AsyncClient(
+        base_url=UPSTREAM_URL,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=30.0,
+        http2=True,
+        # Upstream bodies are relayed still encoded, so only ask for compression
+        # when the caller did; a forwarded Accept-Encoding overrides this
+        headers={"Accept-Encoding": "identity"},
+    )
+    try:
+        yield
+    finally:
+        await app.state.client.aclose()
+
 # Create FastAPI app
 app = FastAPI(
     title="Taskmaster Relay",
     description="A relay server for the Taskmaster MCP server",
-    version="1.0.0"
+    version="1.0.0",
+    # /openapi.json serves the taskmaster schema below, not FastAPI's own
+    openapi_url=None,
+    lifespan=lifespan
 )
 
+# Static CORS preflight response, shared by FastCORS and options_proxy
+_PREFLIGHT_RESPONSE_BODY = b"{}"
+_PREFLIGHT_HEADERS_DICT = {
+    "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Authorization",
+    "Access-Control-Allow-Credentials": "false",
+    "Access-Control-Max-Age": "86400"  # 24 hours
+}
+_PREFLIGHT_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_PREFLIGHT_RESPONSE_BODY)).encode("latin-1")),
+    (b"access-control-allow-origin", b"*"),
+] + [
+    (key.lower().encode("latin-1"), value.encode("latin-1"))
+    for key, value in _PREFLIGHT_HEADERS_DICT.items()
+]
+# Preflights naming Access-Control-Request-Headers get those echoed back
+# (allowing any header), so that case starts from the list without ours
+_PREFLIGHT_HEADERS_WITHOUT_ALLOW_HEADERS = [
+    (key, value)
+    for key, value in _PREFLIGHT_HEADERS
+    if key != b"access-control-allow-headers"
+]
+_ALLOW_ORIGIN_HEADER = (b"access-control-allow-origin", b"*")
+
+class FastCORS:
+    """Pure ASGI CORS layer allowing all origins with precomputed headers"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Answer CORS preflights here; plain OPTIONS requests fall through
+        if scope["method"] == "OPTIONS":
+            is_preflight = False
+            requested_headers = None
+            for key, value in scope["headers"]:
+                if key == b"access-control-request-method":
+                    is_preflight = True
+                elif key == b"access-control-request-headers":
+                    requested_headers = value
+            if is_preflight:
+                if requested_headers is None:
+                    headers = _PREFLIGHT_HEADERS
+                else:
+                    headers = _PREFLIGHT_HEADERS_WITHOUT_ALLOW_HEADERS + [
+                        (b"access-control-allow-headers", requested_headers)
+                    ]
+                await send({
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": headers,
+                })
+                await send({"type": "http.response.body", "body": _PREFLIGHT_RESPONSE_BODY})
+                return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": [*message.get("headers", ()), _ALLOW_ORIGIN_HEADER]}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
 # Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins
-    allow_credentials=False,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(FastCORS)
+
+# Compress larger dynamic responses; added last so it wraps FastCORS and
+# sees final headers. It only matches lowercase header names, so responses
+# already carrying content-encoding (the precompressed schema, encoded
+# upstream bodies relayed by ProxyASGI) pass through untouched only because
+# every handler emits lowercase names.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
-# Define OpenAPI schema for taskmaster functions
-TASKMASTER_FUNCTIONS = {
+# Define OpenAPI schema for taskmaster functions (read-only; everything
+# derived from it below is built once at import)
+TASKMASTER_FUNCTIONS = MappingProxyType({
     "list_tasks": {
         "description": "List all tasks",
         "parameters": {},
@@ -166,201 +259,344 @@ TASKMASTER_FUNCTIONS = {
             }
         }
     }
-}
+})
 
-@lru_cache(maxsize=1)
-def get_openapi_schema_data():
-    """Generate OpenAPI schema for taskmaster functions (cached)"""
-    return {
-        "openapi": "3.0.0",
-        "info": {
-            "title": "Taskmaster API",
-            "description": "API for managing tasks",
-            "version": "1.0.0"
-        },
-        "security": [{"none": []}],
-        "components": {
-            "securitySchemes": {
-                "none": {
-                    "type": "http",
-                    "scheme": "bearer",
-                    "description": "No authentication required. This API is open."
-                }
+# OpenAPI schema for taskmaster functions
+_OPENAPI_SCHEMA = {
+    "openapi": "3.0.0",
+    "info": {
+        "title": "Taskmaster API",
+        "description": "API for managing tasks",
+        "version": "1.0.0"
+    },
+    "security": [{"none": []}],
+    "components": {
+        "securitySchemes": {
+            "none": {
+                "type": "http",
+                "scheme": "bearer",
+                "description": "No authentication required. This API is open."
             }
-        },
-        "paths": {
-            f"/proxy/{function_name}": {
-                "post": {
-                    "summary": function_info["description"],
-                    "security": [{"none": []}],
-                    "requestBody": {
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "function_call": {
-                                            "type": "object",
-                                            "properties": {
-                                                "name": {
-                                                    "type": "string",
-                                                    "enum": [function_name]
-                                                },
-                                                "parameters": {
-                                                    "type": "object",
-                                                    "properties": function_info["parameters"]
-                                                }
+        }
+    },
+    "paths": {
+        f"/proxy/{function_name}": {
+            "post": {
+                "summary": function_info["description"],
+                "security": [{"none": []}],
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "function_call": {
+                                        "type": "object",
+                                        "properties": {
+                                            "name": {
+                                                "type": "string",
+                                                "enum": [function_name]
                                             },
-                                            "required": ["name", "parameters"]
-                                        }
-                                    },
-                                    "required": ["function_call"]
+                                            "parameters": {
+                                                "type": "object",
+                                                "properties": function_info["parameters"]
+                                            }
+                                        },
+                                        "required": ["name", "parameters"]
+                                    }
                                 },
-                                "example": function_info["example"]
-                            }
+                                "required": ["function_call"]
+                            },
+                            "example": function_info["example"]
                         }
-                    },
-                    "responses": {
-                        "200": {
-                            "description": "Successful response",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object"
-                                    }
+                    }
+                },
+                "responses": {
+                    "200": {
+                        "description": "Successful response",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object"
                                 }
                             }
                         }
                     }
                 }
             }
-            for function_name, function_info in TASKMASTER_FUNCTIONS.items()
         }
+        for function_name, function_info in TASKMASTER_FUNCTIONS.items()
     }
+}
+
+class _StaticPayload(NamedTuple):
+    """Precomputed identity and gzip encodings of a static response body"""
+    content: bytes
+    etag: str
+    gzip_content: bytes
+    gzip_etag: str
+
+def _precompute_payload(content: bytes) -> _StaticPayload:
+    """Hash and gzip a static body once (mtime=0 keeps workers' ETags identical)"""
+    digest = hashlib.blake2b(content, digest_size=8).hexdigest()
+    return _StaticPayload(
+        content=content,
+        etag=f'"{digest}"',
+        gzip_content=gzip.compress(content, compresslevel=6, mtime=0),
+        gzip_etag=f'"{digest}-gzip"'
+    )
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weakly compare an If-None-Match header value against an ETag"""
+    if if_none_match == etag or if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+def _static_response(request: Request, payload: _StaticPayload, media_type: str, vary: str) -> Response:
+    """Serve a precomputed payload, gzip-encoded when accepted, or a 304 if the client has it"""
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        content, etag = payload.gzip_content, payload.gzip_etag
+        headers = {"ETag": etag, "Content-Encoding": "gzip", "Vary": vary}
+    else:
+        content, etag = payload.content, payload.etag
+        headers = {"ETag": etag, "Vary": vary}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Vary": vary})
+    return Response(content=content, media_type=media_type, headers=headers)
+
+# Serialize and compress the static schema once; handlers only hand out these bytes
+_OPENAPI_JSON = _precompute_payload(orjson.dumps(_OPENAPI_SCHEMA))
+_OPENAPI_TEXT = _precompute_payload(orjson.dumps(_OPENAPI_SCHEMA, option=orjson.OPT_INDENT_2))
 
-@app.get("/openapi.json")
 async def get_openapi_schema(request: Request):
     """Return OpenAPI schema for taskmaster functions"""
-    schema = get_openapi_schema_data()
-    
     # Check if client prefers text format
     accept_header = request.headers.get("accept", "")
     if "text/" in accept_header:
-        return Response(content=json.dumps(schema, indent=2), media_type="text/plain; charset=utf-8")
+        return _static_response(request, _OPENAPI_TEXT, "text/plain; charset=utf-8", "Accept, Accept-Encoding")
     else:
-        return JSONResponse(content=schema, headers={"Content-Type": "application/json"}, gzip=True)
+        return _static_response(request, _OPENAPI_JSON, "application/json", "Accept, Accept-Encoding")
 
-@app.get("/openapi.txt")
-async def get_openapi_schema_text():
+async def get_openapi_schema_text(request: Request):
     """Return OpenAPI schema as plain text for LLM tooling"""
-    schema = get_openapi_schema_data()
-    return PlainTextResponse(
-        content=json.dumps(schema, indent=2),
-        headers={"Content-Type": "text/plain; charset=utf-8"}
-    )
+    return _static_response(request, _OPENAPI_TEXT, "text/plain; charset=utf-8", "Accept-Encoding")
+
+# Static routes are registered on the Starlette router directly, bypassing
+# FastAPI's dependency injection and response-model handling
+app.add_route("/openapi.json", get_openapi_schema, methods=["GET"])
+app.add_route("/openapi.txt", get_openapi_schema_text, methods=["GET"])
     
 
-@app.get("/health")
-async def health_check(request: Request):
-    """Health check endpoint"""
-    accept_header = request.headers.get("accept", "")
-    if "application/health" in accept_header:
-        return Response(status_code=204, media_type="application/health+json")
-    else:
-        return {"ok": True}
+# Static health check responses
+_HEALTH_BODY = b'{"ok":true}'
+_HEALTH_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTH_BODY)).encode("latin-1")),
+]
+_HEALTH_NO_CONTENT_HEADERS = [(b"content-type", b"application/health+json")]
 
-@app.post("/proxy/{endpoint:path}")
-async def proxy(endpoint: str, request: Request):
-    """Proxy requests to the upstream server"""
-    try:
-        # Parse request body
-        body = await request.body()
-        
-        # Log the request
-        logger.info(f"Received request for endpoint: {endpoint}")
-        if body:
-            try:
-                body_json = json.loads(body)
-                logger.info(f"Request body: {body_json}")
-            except json.JSONDecodeError:
-                logger.warning("Request body is not valid JSON")
-        
-        # Prepare headers
-        headers = dict(request.headers)
-        
-        # Strip Authorization header to avoid CORS issues
-        if "authorization" in headers:
-            del headers["authorization"]
-        if "Authorization" in headers:
-            del headers["Authorization"]
-        
-        # Forward the request to the upstream server
-        async with httpx.AsyncClient() as client:
-            upstream_url = f"{UPSTREAM_URL}/mcp/{endpoint}"
-            logger.info(f"Forwarding request to: {upstream_url}")
+class HealthASGI:
+    """Pure ASGI health check endpoint serving a static payload"""
+
+    async def __call__(self, scope, receive, send):
+        # Clients asking for application/health get a bodiless 204
+        for key, value in scope["headers"]:
+            if key == b"accept" and b"application/health" in value:
+                await send({
+                    "type": "http.response.start",
+                    "status": 204,
+                    "headers": _HEALTH_NO_CONTENT_HEADERS,
+                })
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": _HEALTH_HEADERS,
+        })
+        await send({"type": "http.response.body", "body": _HEALTH_BODY})
+
+app.add_route("/health", HealthASGI(), methods=["GET"])
+
+# Hop-by-hop headers, which a proxy must not forward in either direction
+_HOP_BY_HOP = frozenset({
+    b"connection",
+    b"keep-alive",
+    b"proxy-authenticate",
+    b"proxy-authorization",
+    b"te",
+    b"trailers",
+    b"transfer-encoding",
+    b"upgrade",
+})
+
+# Request headers not forwarded upstream: hop-by-hop ones, Authorization
+# (avoids CORS issues) and Host (httpx sets it from the upstream URL).
+# Content-Length is kept so the streamed body goes upstream sized.
+_REQUEST_SKIP_HEADERS = _HOP_BY_HOP | {b"authorization", b"host"}
+
+# Upstream response headers that are not relayed: hop-by-hop ones, CORS
+# ones since FastCORS and the proxy set those themselves, and Date/Server
+# which uvicorn adds to every response
+_UPSTREAM_RESPONSE_SKIP_HEADERS = _HOP_BY_HOP | {
+    b"access-control-allow-origin",
+    b"access-control-allow-credentials",
+    b"date",
+    b"server",
+}
+
+# Upstream URLs for the known functions, parsed once; absolute URLs also let
+# httpx skip merging with the client's base_url
+_UPSTREAM_URLS = {
+    function_name: httpx.URL(f"{UPSTREAM_URL}/mcp/{function_name}")
+    for function_name in TASKMASTER_FUNCTIONS
+}
+
+# Precomputed proxy error response skeletons
+_ERROR_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"access-control-allow-credentials", b"false"),
+]
+_METHOD_NOT_ALLOWED_BODY = b'{"detail":"Method Not Allowed"}'
+_METHOD_NOT_ALLOWED_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_METHOD_NOT_ALLOWED_BODY)).encode("latin-1")),
+    (b"allow", b"POST, OPTIONS"),
+]
+
+async def _send_error(send, message: str, status_code: int = 500):
+    """Send a JSON error response built on the precomputed error headers"""
+    body = orjson.dumps({"error": message})
+    await send({
+        "type": "http.response.start",
+        "status": status_code,
+        "headers": _ERROR_HEADERS + [(b"content-length", str(len(body)).encode("latin-1"))],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+class ProxyASGI:
+    """Pure ASGI app that proxies POST /proxy/{endpoint} to the upstream server
+
+    Mounted at /proxy so requests skip FastAPI's Request construction,
+    parameter validation and response re-encoding; the upstream body is
+    streamed back byte-for-byte, still in its upstream content-encoding.
+    """
+
+    @staticmethod
+    async def _stream_body(receive):
+        """Yield request body chunks upstream as the ASGI server delivers them"""
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise ClientDisconnect()
+            chunk = message.get("body", b"")
+            if chunk:
+                yield chunk
+            more_body = message.get("more_body", False)
+
+    async def __call__(self, scope, receive, send):
+        if scope["method"] != "POST":
+            await send({
+                "type": "http.response.start",
+                "status": 405,
+                "headers": _METHOD_NOT_ALLOWED_HEADERS,
+            })
+            await send({"type": "http.response.body", "body": _METHOD_NOT_ALLOWED_BODY})
+            return
+
+        endpoint = scope["path"][len(scope["root_path"]) + 1:]
+        try:
+            # Log the request; the body is streamed, never buffered or parsed
+            log_info = logger.isEnabledFor(logging.INFO)
+            if log_info:
+                logger.info("Received request for endpoint: %s", endpoint)
             
-            response = await client.post(
+            # Prepare headers: ASGI names are already lowercase, so a single
+            # set lookup per header filters them
+            headers = [
+                (key, value)
+                for key, value in scope["headers"]
+                if key not in _REQUEST_SKIP_HEADERS
+            ]
+            
+            # Forward the request to the upstream server over the shared client
+            client = scope["app"].state.client
+            upstream_url = _UPSTREAM_URLS.get(endpoint)
+            if upstream_url is None:
+                upstream_url = f"{UPSTREAM_URL}/mcp/{endpoint}"
+            if log_info:
+                logger.info("Forwarding request to: %s", upstream_url)
+            
+            upstream_request = client.build_request(
+                "POST",
                 upstream_url,
-                content=body,
-                headers=headers,
-                timeout=30.0
+                content=self._stream_body(receive),
+                headers=headers
             )
+            response = await client.send(upstream_request, stream=True)
             
             # Log the response
-            logger.info(f"Received response with status code: {response.status_code}")
-            
-            # Return the response
-            content = response.content
-            response_headers = dict(response.headers)
-            
-            # Add CORS headers
-            response_headers["Access-Control-Allow-Origin"] = "*"
-            response_headers["Access-Control-Allow-Credentials"] = "false"
+            if log_info:
+                logger.info("Received response with status code: %d", response.status_code)
+        except ClientDisconnect:
+            return
+        except httpx.RequestError as e:
+            logger.error("Error forwarding request: %s", e)
+            await _send_error(send, f"Error forwarding request: {str(e)}")
+            return
+        except Exception as e:
+            logger.error("Unexpected error: %s", e)
+            await _send_error(send, f"Unexpected error: {str(e)}")
+            return
+
+        # Stream the upstream body through undecoded
+        try:
+            # ASGI header names must be lowercase, but an HTTP/1.1 upstream's
+            # raw headers keep their original casing
+            response_headers = [
+                (lower_key, value)
+                for key, value in response.headers.raw
+                if (lower_key := key.lower()) not in _UPSTREAM_RESPONSE_SKIP_HEADERS
+            ]
+            response_headers.append((b"access-control-allow-credentials", b"false"))
             
-            return JSONResponse(
-                content=response.json() if content else {},
-                status_code=response.status_code,
-                headers=response_headers
-            )
-    except httpx.RequestError as e:
-        logger.error(f"Error forwarding request: {str(e)}")
-        return JSONResponse(
-            content={"error": f"Error forwarding request: {str(e)}"},
-            status_code=500,
-            headers={
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Credentials": "false"
-            }
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        return JSONResponse(
-            content={"error": f"Unexpected error: {str(e)}"},
-            status_code=500,
-            headers={
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Credentials": "false"
-            }
-        )
+            await send({
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": response_headers,
+            })
+            # Hold back one chunk so the last one closes the body; a
+            # single-chunk reply then goes out as one complete message,
+            # which GZipMiddleware passes through below its size threshold
+            # instead of re-encoding it as a gzip stream
+            pending = b""
+            async for chunk in response.aiter_raw():
+                if pending:
+                    await send({"type": "http.response.body", "body": pending, "more_body": True})
+                pending = chunk
+            await send({"type": "http.response.body", "body": pending})
+        finally:
+            await response.aclose()
 
-@app.options("/proxy/{endpoint:path}")
-async def options_proxy(endpoint: str):
+async def options_proxy(request: Request):
     """Handle OPTIONS requests for CORS preflight"""
-    return JSONResponse(
-        content={},
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type, Authorization",
-            "Access-Control-Allow-Credentials": "false",
-            "Access-Control-Max-Age": "86400"  # 24 hours
-        }
+    return Response(
+        content=_PREFLIGHT_RESPONSE_BODY,
+        media_type="application/json",
+        headers=_PREFLIGHT_HEADERS_DICT
     )
 
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    """Root endpoint that returns HTML documentation"""
-    html_content = """
+# Registered before the /proxy mount so OPTIONS requests match this route first
+app.add_route("/proxy/{endpoint:path}", options_proxy, methods=["OPTIONS"])
+app.mount("/proxy", ProxyASGI())
+
+def _build_root_html() -> str:
+    """Render the HTML documentation page for the taskmaster functions"""
+    parts = ["""
     <!DOCTYPE html>
     <html>
     <head>
@@ -394,11 +630,10 @@ async def root():
         </div>
         
         <h2>Available Functions</h2>
-    """
+    """]
     
     for function_name, function_info in TASKMASTER_FUNCTIONS.items():
-        example = json.dumps(function_info["example"], indent=4)
-        html_content += f"""
+        parts.append(f"""
         <div class="endpoint">
             <h3>{function_name}</h3>
             <p class="description">{function_info["description"]}</p>
@@ -406,16 +641,37 @@ async def root():
     -H "Content-Type: application/json" \
     -d '{json.dumps(function_info["example"])}'</pre>
         </div>
-        """
+        """)
     
-    html_content += """
+    parts.append("""
     </body>
     </html>
-    """
+    """)
     
-    return HTMLResponse(content=html_content, media_type="text/html")
+    return "".join(parts)
+
+# TASKMASTER_FUNCTIONS is static, so the page only needs rendering once
+_ROOT_HTML_BYTES = _build_root_html().encode("utf-8")
+
+async def root(request: Request):
+    """Root endpoint that returns HTML documentation"""
+    return HTMLResponse(content=_ROOT_HTML_BYTES, media_type="text/html")
+
+app.add_route("/", root, methods=["GET"])
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", "8080"))
-    logger.info(f"Starting Taskmaster Relay on port {port}")
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    logger.info("Starting Taskmaster Relay on port %d", port)
+    # Name loop/http explicitly so a missing uvicorn[standard] extra fails loudly;
+    # workers > 1 requires the app as an import string
+    uvicorn.run(
+        "relay:app",
+        host="0.0.0.0",
+        port=port,
+        workers=int(os.environ.get("WORKERS", os.cpu_count() or 2)),
+        loop="uvloop",
+        http="httptools",
+        interface="asgi3",
+        access_log=False,
+        log_level=os.environ.get("LOG_LEVEL", "info").lower()
+    )
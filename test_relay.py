@@ -0,0 +1,114 @@
+"""
+Tests for the Taskmaster relay proxy.
+"""
+
+import gzip
+import hashlib
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import relay
+
+# Large enough for GZipMiddleware to act on it (>1 KB) even once gzipped
+UPSTREAM_BODY = b'{"tasks":[' + b",".join(
+    b'{"id":"task-%03d","title":"%s"}' % (i, hashlib.sha256(b"%d" % i).hexdigest().encode("latin-1"))
+    for i in range(100)
+) + b"]}"
+
+
+class _UpstreamStream(httpx.AsyncByteStream):
+    """Streamed upstream body, like a real transport returns"""
+
+    def __init__(self, content: bytes, chunk_size: int):
+        self.content = content
+        self.chunk_size = chunk_size
+
+    async def __aiter__(self):
+        for start in range(0, len(self.content), self.chunk_size):
+            yield self.content[start:start + self.chunk_size]
+
+
+def _mixed_case_upstream(content_encoding=None, chunk_size=None):
+    """Mock an HTTP/1.1 upstream whose raw header names keep their casing"""
+    body = gzip.compress(UPSTREAM_BODY) if content_encoding == "gzip" else UPSTREAM_BODY
+    chunk_size = chunk_size or len(body)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        headers = [(b"Content-Type", b"application/json")]
+        if content_encoding:
+            headers.append((b"Content-Encoding", content_encoding.encode("latin-1")))
+        headers.append((b"Content-Length", str(len(body)).encode("latin-1")))
+        return httpx.Response(200, headers=headers, stream=_UpstreamStream(body, chunk_size))
+
+    return httpx.MockTransport(handler), body
+
+
+@pytest.fixture
+def client_with_upstream():
+    """Yield a factory swapping the relay's shared client onto a mock upstream"""
+    with TestClient(relay.app) as test_client:
+        original = relay.app.state.client
+
+        def use(transport: httpx.MockTransport) -> TestClient:
+            relay.app.state.client = httpx.AsyncClient(base_url=relay.UPSTREAM_URL, transport=transport)
+            return test_client
+
+        yield use
+        relay.app.state.client = original
+
+
+def _post_raw(test_client: TestClient, accept_encoding: str):
+    """POST to the proxy and return the response with its undecoded body"""
+    request = test_client.build_request(
+        "POST",
+        "/proxy/list_tasks",
+        content=b"{}",
+        headers={"Accept-Encoding": accept_encoding},
+    )
+    response = test_client.send(request, stream=True)
+    raw = b"".join(response.iter_raw())
+    response.close()
+    return response, raw
+
+
+def test_proxy_relays_lowercase_header_names(client_with_upstream):
+    test_client = client_with_upstream(_mixed_case_upstream()[0])
+    response, _ = _post_raw(test_client, "identity")
+    assert all(key == key.lower() for key, _ in response.headers.raw)
+
+
+def test_proxy_passes_gzip_upstream_body_through_unchanged(client_with_upstream):
+    transport, upstream_body = _mixed_case_upstream(content_encoding="gzip")
+    test_client = client_with_upstream(transport)
+    response, raw = _post_raw(test_client, "gzip")
+
+    assert response.status_code == 200
+    assert response.headers.get_list("content-encoding") == ["gzip"]
+    assert response.headers.get_list("content-length") == [str(len(upstream_body))]
+    assert raw == upstream_body
+    assert gzip.decompress(raw) == UPSTREAM_BODY
+
+
+def test_proxy_compresses_plain_upstream_body_once(client_with_upstream):
+    test_client = client_with_upstream(_mixed_case_upstream()[0])
+    response, raw = _post_raw(test_client, "gzip")
+
+    assert response.status_code == 200
+    assert response.headers.get_list("content-encoding") == ["gzip"]
+    content_length = response.headers.get_list("content-length")
+    assert len(content_length) <= 1
+    if content_length:
+        assert content_length == [str(len(raw))]
+    assert gzip.decompress(raw) == UPSTREAM_BODY
+
+
+def test_proxy_streams_chunked_plain_upstream_body_without_stale_length(client_with_upstream):
+    test_client = client_with_upstream(_mixed_case_upstream(chunk_size=2048)[0])
+    response, raw = _post_raw(test_client, "gzip")
+
+    assert response.status_code == 200
+    assert response.headers.get_list("content-encoding") == ["gzip"]
+    assert response.headers.get_list("content-length") == []
+    assert gzip.decompress(raw) == UPSTREAM_BODY